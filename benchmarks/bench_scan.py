@@ -0,0 +1,71 @@
+"""Compares `dew.scan` against parsing every line and filtering after.
+
+```txt
+PYTHONPATH=. python benchmarks/bench_scan.py
+```
+"""
+
+import random
+import timeit
+
+import dew
+
+LINES = 200_000
+REPEAT = 3
+
+
+def make_log(n: int) -> list[str]:
+    rng = random.Random(0)
+    verbs = ["add", "remove", "set", "get", "ban", "kick"]
+    modes = ["fast", "slow", "safe"]
+
+    return [
+        f"{rng.choice(verbs)} user{i} 'display name {i}' "
+        f'mode={rng.choice(modes)} level={rng.randint(0, 99)} reason="spam {i}"'
+        for i in range(n)
+    ]
+
+
+def parse_then_filter(lines: list[str]) -> list[list[dew.types.Argument]]:
+    matches = []
+
+    for line in lines:
+        args = dew.parse(line)
+        first = args[0].value.value if args else None
+        kwargs = {
+            a.value.name: a.value.value
+            for a in args
+            if isinstance(a.value, dew.types.KeywordArgument)
+        }
+
+        if first == "ban" or kwargs.get("mode") == "fast":
+            matches.append(args)
+
+    return matches
+
+
+def main() -> None:
+    lines = make_log(LINES)
+
+    arg_where = dew.q.arg(0) == "ban"
+    either_where = arg_where | (dew.q.kwarg("mode") == "fast")
+
+    assert list(dew.scan(lines, either_where)) == parse_then_filter(lines)
+
+    cases = {
+        "parse then filter": lambda: parse_then_filter(lines),
+        "scan arg(0) == 'ban' | kwarg('mode') == 'fast'": lambda: list(
+            dew.scan(lines, either_where)
+        ),
+        "scan arg(0) == 'ban'": lambda: list(dew.scan(lines, arg_where)),
+    }
+
+    print(f"{LINES} lines, best of {REPEAT}")
+
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=REPEAT))
+        print(f"{name:<50} {best:8.3f}s {LINES / best:>12,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
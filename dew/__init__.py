@@ -89,11 +89,23 @@ great_argument = 'this is a great argument'
 
 import typing as t
 
+from dew import query as q
+from dew.columnar import ColumnarBatch, parse_columnar
 from dew.parser import Command, parse
+from dew.query import scan
+from dew.template import PreparedCommand, prepare
+from dew.types import Limits
 
 __all__ = [
+    "ColumnarBatch",
     "Command",
+    "Limits",
+    "PreparedCommand",
     "parse",
+    "parse_columnar",
+    "prepare",
+    "q",
+    "scan",
 ]
 
 __author__: t.Final[str] = "jma"
@@ -0,0 +1,446 @@
+# MIT License
+#
+# Copyright (c) 2025 jma
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# ruff: noqa: W505
+
+r"""dew command-line batch tool.
+
+Reads newline-delimited commands from stdin or files and writes one
+record per command.
+
+```txt
+$ printf 'add rgb r=100\n' | python -m dew
+{"args": ["add", "rgb"], "kwargs": [["r", "100"]]}
+
+$ printf 'add rgb r=100\n' | python -m dew --format tsv
+<stdin>	1	arg	0	add
+<stdin>	1	arg	1	rgb
+<stdin>	1	kwarg	r	100
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import sys
+import time
+
+import typing_extensions as t
+
+from dew.error import LimitExceeded, ParserError, TokenizerError
+from dew.parser import DEFAULT_LIMITS, Command, parse
+from dew.types import KeywordArgument, Limits
+
+OutputFormat: t.TypeAlias = t.Literal["jsonl", "tsv"]
+
+BUFFER_SIZE: t.Final[int] = 1 << 20
+"""The buffer size, in bytes, of the input and output streams."""
+
+STDIN_NAME: t.Final[str] = "<stdin>"
+"""The file name reported for lines read from stdin."""
+
+CHUNK_SIZE: t.Final[int] = 4096
+"""The number of lines handed to a worker at a time."""
+
+TSV_ESCAPES: t.Final[dict[int, str]] = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+class Chunk(t.NamedTuple):
+    """A batch of input lines to be processed by a worker."""
+
+    file_name: str
+    first_line_number: int
+    lines: list[bytes]
+    output_format: OutputFormat
+    validate_only: bool
+    limits: Limits
+
+
+class ChunkResult(t.NamedTuple):
+    """The processed output of a `Chunk`."""
+
+    output: str
+    size: int
+    parsed: int
+    errors: list[str]
+
+
+def to_command(inp: str, limits: Limits = DEFAULT_LIMITS) -> Command:
+    """Parses the input into its `Command` representation.
+
+    Parameters:
+        inp (str): The input to be parsed.
+        limits (Limits): The limits enforced on the input.
+
+    Returns:
+        Command: The parsed command data.
+    """
+    command: Command = {"args": [], "kwargs": []}
+
+    for arg in parse(inp, limits):
+        value = arg.value
+
+        if isinstance(value, KeywordArgument):
+            command["kwargs"].append((value.name, value.value))
+        else:
+            command["args"].append(value.value)
+
+    return command
+
+
+def format_jsonl(command: Command) -> str:
+    """Formats a `Command` as a JSON Lines record.
+
+    Parameters:
+        command (Command): The command to format.
+
+    Returns:
+        str: The newline-terminated JSON record.
+    """
+    return json.dumps(command, ensure_ascii=False) + "\n"
+
+
+def format_tsv(file_name: str, line_number: int, command: Command) -> str:
+    """Formats a `Command` as TSV rows, one row per argument.
+
+    Each row holds the file name, the line number within that file, the
+    argument kind (`arg` or `kwarg`), the position or keyword name and
+    the value. Tabs, newlines and backslashes are backslash-escaped.
+
+    Parameters:
+        file_name (str): The input file the command came from.
+        line_number (int): The input line the command came from.
+        command (Command): The command to format.
+
+    Returns:
+        str: The newline-terminated TSV rows.
+    """
+    location = f"{file_name.translate(TSV_ESCAPES)}\t{line_number}"
+
+    rows = [
+        f"{location}\targ\t{index}\t{value.translate(TSV_ESCAPES)}\n"
+        for index, value in enumerate(command["args"])
+    ]
+    rows.extend(
+        f"{location}\tkwarg\t{name.translate(TSV_ESCAPES)}"
+        f"\t{value.translate(TSV_ESCAPES)}\n"
+        for name, value in command["kwargs"]
+    )
+
+    return "".join(rows)
+
+
+def process_chunk(chunk: Chunk) -> ChunkResult:
+    """Parses and formats every line of a `Chunk`.
+
+    Blank lines are skipped, lines that fail to decode or parse are
+    reported as `file:line: error` messages instead of being written.
+
+    Parameters:
+        chunk (Chunk): The chunk to process.
+
+    Returns:
+        ChunkResult: The formatted output, the input size in bytes,
+        the number of parsed commands and the errors found.
+    """
+    output: list[str] = []
+    errors: list[str] = []
+    parsed = 0
+
+    for line_number, raw in enumerate(chunk.lines, chunk.first_line_number):
+        try:
+            line = raw.decode("utf-8").rstrip("\r\n")
+
+            if not line or line.isspace():
+                continue
+
+            command = to_command(line, chunk.limits)
+
+        except (
+            UnicodeDecodeError,
+            TokenizerError,
+            ParserError,
+            LimitExceeded,
+        ) as e:
+            errors.append(f"{chunk.file_name}:{line_number}: {type(e).__name__}: {e}\n")
+            continue
+
+        parsed += 1
+
+        if chunk.validate_only:
+            continue
+
+        if chunk.output_format == "jsonl":
+            output.append(format_jsonl(command))
+        else:
+            output.append(format_tsv(chunk.file_name, line_number, command))
+
+    size = sum(map(len, chunk.lines))
+
+    return ChunkResult("".join(output), size, parsed, errors)
+
+
+def iter_chunks(
+    streams: t.Iterable[tuple[str, t.BinaryIO]],
+    output_format: OutputFormat,
+    *,
+    validate_only: bool,
+    limits: Limits,
+) -> t.Iterator[Chunk]:
+    """Splits the input streams into `Chunk`s of `CHUNK_SIZE` lines.
+
+    Chunks never span streams, line numbers start over in each stream.
+
+    Parameters:
+        streams (Iterable[tuple[str, BinaryIO]]): The input streams and
+            their file names.
+        output_format (OutputFormat): The output format of the chunks.
+        validate_only (bool): Whether the chunks only validate input.
+        limits (Limits): The limits enforced on each line.
+
+    Yields:
+        Chunk: The next chunk of lines.
+    """
+    for file_name, stream in streams:
+        line_number = 1
+
+        while batch := list(itertools.islice(stream, CHUNK_SIZE)):
+            yield Chunk(
+                file_name,
+                line_number,
+                batch,
+                output_format,
+                validate_only,
+                limits,
+            )
+            line_number += len(batch)
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    """Builds the command-line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The argument parser.
+    """
+    argument_parser = argparse.ArgumentParser(
+        prog="dew",
+        description="Parse newline-delimited dew commands.",
+    )
+    argument_parser.add_argument(
+        "files",
+        nargs="*",
+        metavar="FILE",
+        help="input files, reads stdin when omitted or '-'",
+    )
+    argument_parser.add_argument(
+        "-f",
+        "--format",
+        choices=("jsonl", "tsv"),
+        default="jsonl",
+        help="output format (default: jsonl)",
+    )
+    argument_parser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="output file, writes stdout when omitted or '-'",
+    )
+    argument_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="number of parsing processes (default: 1)",
+    )
+    argument_parser.add_argument(
+        "--validate-only",
+        action="store_true",
+        help="only report invalid commands, writes no output",
+    )
+    argument_parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="print throughput and error counts to stderr",
+    )
+    argument_parser.add_argument(
+        "--max-input-length",
+        type=int,
+        metavar="N",
+        help="reject commands longer than N characters",
+    )
+    argument_parser.add_argument(
+        "--max-tokens",
+        type=int,
+        metavar="N",
+        help="reject commands with more than N tokens",
+    )
+    argument_parser.add_argument(
+        "--max-args",
+        type=int,
+        metavar="N",
+        help="reject commands with more than N arguments",
+    )
+    argument_parser.add_argument(
+        "--max-value-length",
+        type=int,
+        metavar="N",
+        help="reject values longer than N characters",
+    )
+
+    return argument_parser
+
+
+def open_inputs(
+    argument_parser: argparse.ArgumentParser,
+    files: t.Iterable[str],
+    stack: contextlib.ExitStack,
+) -> list[tuple[str, t.BinaryIO]]:
+    """Opens the input files, `-` being stdin.
+
+    Parameters:
+        argument_parser (argparse.ArgumentParser): The parser reporting
+            files that cannot be opened.
+        files (Iterable[str]): The input file names.
+        stack (contextlib.ExitStack): The stack closing the files.
+
+    Returns:
+        list[tuple[str, BinaryIO]]: The file names and their streams.
+    """
+    streams: list[tuple[str, t.BinaryIO]] = []
+
+    for file in files:
+        if file == "-":
+            stdin = open(sys.stdin.fileno(), "rb", BUFFER_SIZE, closefd=False)  # noqa: SIM115
+            streams.append((STDIN_NAME, stack.enter_context(stdin)))
+            continue
+
+        try:
+            stream = open(file, "rb", BUFFER_SIZE)  # noqa: PTH123, SIM115
+        except OSError as e:
+            argument_parser.error(f"cannot open '{file}': {e.strerror}")
+
+        streams.append((file, stack.enter_context(stream)))
+
+    return streams
+
+
+def open_output(
+    argument_parser: argparse.ArgumentParser,
+    file: str | None,
+    stack: contextlib.ExitStack,
+) -> t.TextIO:
+    """Opens the output file, stdout when `None` or `-`.
+
+    Parameters:
+        argument_parser (argparse.ArgumentParser): The parser reporting
+            a file that cannot be opened.
+        file (str | None): The output file name.
+        stack (contextlib.ExitStack): The stack closing the file.
+
+    Returns:
+        TextIO: The output stream.
+    """
+    if file is None or file == "-":
+        sys.stdout.flush()
+        out = io.TextIOWrapper(sys.stdout.buffer, "utf-8", newline="")
+        stack.callback(out.detach)
+
+        return out
+
+    try:
+        output = open(file, "w", BUFFER_SIZE, "utf-8", newline="")  # noqa: PTH123, SIM115
+    except OSError as e:
+        argument_parser.error(f"cannot open '{file}': {e.strerror}")
+
+    return stack.enter_context(output)
+
+
+def main(argv: t.Sequence[str] | None = None) -> int:
+    """Runs the command-line tool.
+
+    Parameters:
+        argv (Sequence[str] | None): The command-line arguments,
+        `sys.argv` when `None`.
+
+    Returns:
+        int: The exit status, `1` if any command was invalid.
+    """
+    argument_parser = build_argument_parser()
+    options = argument_parser.parse_args(argv)
+
+    if options.workers < 1:
+        argument_parser.error("--workers must be at least 1")
+
+    with contextlib.ExitStack() as stack:
+        streams = open_inputs(argument_parser, options.files or ["-"], stack)
+        out = open_output(argument_parser, options.output, stack)
+
+        err = sys.stderr
+
+        chunks = iter_chunks(
+            streams,
+            options.format,
+            validate_only=options.validate_only,
+            limits=Limits(*(getattr(options, field) for field in Limits._fields)),
+        )
+
+        if options.workers > 1:
+            pool = stack.enter_context(multiprocessing.Pool(options.workers))
+            results = pool.imap(process_chunk, chunks)
+        else:
+            results = map(process_chunk, chunks)
+
+        started = time.perf_counter()
+        size = 0
+        parsed = 0
+        errors = 0
+
+        for result in results:
+            out.write(result.output)
+
+            size += result.size
+            parsed += result.parsed
+            errors += len(result.errors)
+
+            if result.errors:
+                err.write("".join(result.errors))
+
+        out.flush()
+
+        if options.stats:
+            elapsed = max(time.perf_counter() - started, 1e-9)
+
+            err.write(
+                f"commands: {parsed}, errors: {errors}, "
+                f"elapsed: {elapsed:.3f}s, "
+                f"throughput: {(parsed + errors) / elapsed:.0f} lines/s, "
+                f"{size / elapsed / 1e6:.2f} MB/s\n"
+            )
+
+    return 1 if errors else 0
@@ -0,0 +1,295 @@
+# MIT License
+#
+# Copyright (c) 2025 jma
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# ruff: noqa: W505
+
+"""dew columnar batch output.
+
+Parses many commands into flat, Arrow-style buffers instead of one
+`Argument` object graph per command.
+
+```py
+import dew
+
+batch = dew.parse_columnar(["add rgb r=100", "ban user mode=fast"])
+
+batch.args(1)  # ['ban', 'user']
+batch.kwargs(1)  # [('mode', 'fast')]
+```
+"""
+
+from __future__ import annotations
+
+import array
+import dataclasses
+
+import typing_extensions as t
+
+from dew.error import LimitExceeded, ParserError, TokenizerError
+from dew.parser import DEFAULT_LIMITS, Parser, Tokenizer
+from dew.types import Argument, KeywordArgument, Limits, PositionalArgument
+
+if t.TYPE_CHECKING:
+    import numpy as np
+
+ErrorMode: t.TypeAlias = t.Literal["raise", "skip"]
+
+OFFSET_TYPECODE: t.Final[str] = "q"
+"""The `array` typecode of the offsets, a signed 64-bit integer."""
+
+
+@dataclasses.dataclass(frozen=True)
+class ColumnarBatch:
+    """A batch of parsed commands stored as flat columnar buffers.
+
+    Strings are stored UTF-8 encoded back to back in a data buffer, the
+    `i`-th string spans `data[offsets[i]:offsets[i + 1]]`. Commands
+    are stored the same way over the strings, the `i`-th command owns
+    the positional arguments `args_offsets[i]:args_offsets[i + 1]` and
+    the keyword arguments `kwargs_offsets[i]:kwargs_offsets[i + 1]`.
+
+    Attributes:
+        args_offsets (array): The positional argument offsets of each
+            command.
+        arg_offsets (array): The byte offsets of each positional
+            argument value.
+        arg_data (memoryview): The positional argument values.
+        kwargs_offsets (array): The keyword argument offsets of each
+            command.
+        kwarg_name_offsets (array): The byte offsets of each keyword
+            argument name.
+        kwarg_name_data (memoryview): The keyword argument names.
+        kwarg_value_offsets (array): The byte offsets of each keyword
+            argument value.
+        kwarg_value_data (memoryview): The keyword argument values.
+        skipped (array): The indices of the inputs skipped as invalid.
+    """
+
+    args_offsets: array.array[int]
+    arg_offsets: array.array[int]
+    arg_data: memoryview
+    kwargs_offsets: array.array[int]
+    kwarg_name_offsets: array.array[int]
+    kwarg_name_data: memoryview
+    kwarg_value_offsets: array.array[int]
+    kwarg_value_data: memoryview
+    skipped: array.array[int]
+
+    def __len__(self) -> int:
+        """Gets the number of commands in the batch.
+
+        Returns:
+            int: The number of commands.
+        """
+        return len(self.args_offsets) - 1
+
+    def __getitem__(self, index: int) -> list[Argument]:
+        """Materializes a command back into its arguments.
+
+        Parameters:
+            index (int): The index of the command.
+
+        Returns:
+            list[Argument]: The arguments of the command.
+        """
+        args = [Argument(PositionalArgument(value)) for value in self.args(index)]
+        kwargs = [
+            Argument(KeywordArgument(name, value)) for name, value in self.kwargs(index)
+        ]
+
+        return args + kwargs
+
+    def args(self, index: int) -> list[str]:
+        """Gets the positional arguments of a command.
+
+        Parameters:
+            index (int): The index of the command.
+
+        Returns:
+            list[str]: The positional argument values.
+        """
+        start, stop = self.__bounds(self.args_offsets, index)
+
+        return [_decode(self.arg_data, self.arg_offsets, i) for i in range(start, stop)]
+
+    def kwargs(self, index: int) -> list[tuple[str, str]]:
+        """Gets the keyword arguments of a command.
+
+        Parameters:
+            index (int): The index of the command.
+
+        Returns:
+            list[tuple[str, str]]: The keyword argument names and values.
+        """
+        start, stop = self.__bounds(self.kwargs_offsets, index)
+
+        return [
+            (
+                _decode(self.kwarg_name_data, self.kwarg_name_offsets, i),
+                _decode(self.kwarg_value_data, self.kwarg_value_offsets, i),
+            )
+            for i in range(start, stop)
+        ]
+
+    def to_numpy(self) -> dict[str, np.ndarray]:
+        """Exposes the buffers as zero-copy NumPy arrays.
+
+        Offsets are exposed as `int64` arrays and data buffers as
+        `uint8` arrays, e.g. `np.diff(arrays["args_offsets"])` gives
+        the number of positional arguments of every command.
+
+        Returns:
+            dict[str, np.ndarray]: The arrays keyed by attribute name.
+
+        Raises:
+            ImportError: raised when NumPy is not installed.
+        """
+        try:
+            import numpy as np  # noqa: PLC0415
+
+        except ImportError as e:
+            err = "NumPy is required for `ColumnarBatch.to_numpy()`"
+
+            raise ImportError(err) from e
+
+        arrays: dict[str, np.ndarray] = {}
+
+        for field in dataclasses.fields(self):
+            buffer = getattr(self, field.name)
+            dtype = np.int64 if isinstance(buffer, array.array) else np.uint8
+
+            arrays[field.name] = np.frombuffer(buffer, dtype=dtype)
+
+        return arrays
+
+    def __bounds(self, offsets: array.array[int], index: int) -> tuple[int, int]:
+        if not -len(self) <= index < len(self):
+            err = "command index out of range"
+
+            raise IndexError(err)
+
+        index %= len(self)
+
+        return offsets[index], offsets[index + 1]
+
+
+def _decode(data: memoryview, offsets: array.array[int], index: int) -> str:
+    return str(data[offsets[index] : offsets[index + 1]], "utf-8")
+
+
+class _StringColumn:
+    def __init__(self) -> None:
+        self.offsets = array.array(OFFSET_TYPECODE, [0])
+        self.data = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def append(self, value: str) -> None:
+        self.data += value.encode("utf-8")
+        self.offsets.append(len(self.data))
+
+    def truncate(self, count: int) -> None:
+        del self.offsets[count + 1 :]
+        del self.data[self.offsets[-1] :]
+
+    def build(self) -> tuple[array.array[int], memoryview]:
+        return self.offsets, memoryview(self.data).toreadonly()
+
+
+def parse_columnar(
+    inputs: t.Iterable[str],
+    limits: Limits = DEFAULT_LIMITS,
+    errors: ErrorMode = "raise",
+) -> ColumnarBatch:
+    """Parses many inputs of the dew command language into a `ColumnarBatch`.
+
+    Values are encoded into the flat buffers as they are parsed, no
+    `Argument` objects are built.
+
+    Parameters:
+        inputs (Iterable[str]): The inputs to be parsed.
+        limits (Limits): The limits enforced on each input, unlimited by
+            default.
+        errors (ErrorMode): `"raise"` to raise on the first invalid
+            input, `"skip"` to leave invalid inputs out of the batch and
+            record their indices in `ColumnarBatch.skipped`.
+
+    Returns:
+        ColumnarBatch: The parsed commands.
+
+    Raises:
+        TokenizerError: raised for an invalid input when `errors` is
+            `"raise"`, the message is prefixed with the input index.
+        ParserError: same as `TokenizerError`.
+        LimitExceeded: same as `TokenizerError`.
+        ValueError: same as `TokenizerError`, for values that cannot be
+            encoded as UTF-8 such as lone surrogates.
+    """
+    args_offsets = array.array(OFFSET_TYPECODE, [0])
+    kwargs_offsets = array.array(OFFSET_TYPECODE, [0])
+    skipped = array.array(OFFSET_TYPECODE)
+
+    arg_column = _StringColumn()
+    kwarg_name_column = _StringColumn()
+    kwarg_value_column = _StringColumn()
+
+    for index, inp in enumerate(inputs):
+        args_count = args_offsets[-1]
+        kwargs_count = kwargs_offsets[-1]
+
+        tokens = Tokenizer(inp, limits).iter_tokens()
+
+        try:
+            for name, value in Parser(tokens, limits).iter_values():
+                if name is None:
+                    arg_column.append(value)
+                else:
+                    kwarg_name_column.append(name)
+                    kwarg_value_column.append(value)
+
+        except (TokenizerError, ParserError, LimitExceeded, UnicodeError) as e:
+            if errors == "raise":
+                err = f"input {index}: {e}"
+                error_type = ValueError if isinstance(e, UnicodeError) else type(e)
+
+                raise error_type(err) from e
+
+            # drop the arguments appended before the error
+            arg_column.truncate(args_count)
+            kwarg_name_column.truncate(kwargs_count)
+            kwarg_value_column.truncate(kwargs_count)
+
+            skipped.append(index)
+            continue
+
+        args_offsets.append(len(arg_column))
+        kwargs_offsets.append(len(kwarg_name_column))
+
+    return ColumnarBatch(
+        args_offsets,
+        *arg_column.build(),
+        kwargs_offsets,
+        *kwarg_name_column.build(),
+        *kwarg_value_column.build(),
+        skipped,
+    )
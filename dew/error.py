@@ -31,3 +31,11 @@ class TokenizerError(Exception):
 
 class ParserError(Exception):
     """Error Class for parsing-related errors."""
+
+
+class LimitExceeded(Exception):  # noqa: N818
+    """Error Class for inputs exceeding the configured `Limits`."""
+
+
+class TemplateError(Exception):
+    """Error Class for preparing and binding command templates."""
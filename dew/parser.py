@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import collections
 import dataclasses
+import re
 import string
 
 import typing_extensions as t
 
-from dew.error import ParserError, TokenizerError
-from dew.types import Argument, KeywordArgument, PositionalArgument
+from dew.error import LimitExceeded, ParserError, TokenizerError
+from dew.types import Argument, KeywordArgument, Limits, PositionalArgument
 
 WHITESPACES: t.Final[str] = " \t\r\n"
 ASSIGNMENT_OPERATOR: t.Final[str] = "="
@@ -51,6 +53,33 @@ VALID_DOUBLE_QUOTED_VALUE_CHARACTERS: t.Final[str] = (
 )
 
 
+def _character_run(characters: str) -> re.Pattern[str]:
+    return re.compile(f"[{re.escape(characters)}]*")
+
+
+WHITESPACES_RUN: t.Final[re.Pattern[str]] = _character_run(WHITESPACES)
+
+
+UNQUOTED_RUN: t.Final[re.Pattern[str]] = _character_run(VALID_VALUE_CHARACTERS)
+
+
+DOUBLE_QUOTED_RUN: t.Final[re.Pattern[str]] = _character_run(
+    VALID_VALUE_CHARACTERS + ASSIGNMENT_OPERATOR + SINGLE_QUOTE + WHITESPACES
+)
+
+
+SINGLE_QUOTED_RUN: t.Final[re.Pattern[str]] = _character_run(
+    VALID_VALUE_CHARACTERS + ASSIGNMENT_OPERATOR + DOUBLE_QUOTES + WHITESPACES
+)
+
+
+DEFAULT_LIMITS: t.Final[Limits] = Limits()
+
+
+MAX_REPORTED_VALUE_LENGTH: t.Final[int] = 32
+"""The number of characters of a token value shown in error messages."""
+
+
 T = t.TypeVar("T")
 
 TokenType: t.TypeAlias = t.Literal["WHITESPACES", "VALUE", "ASSIGN_OP"]
@@ -78,10 +107,13 @@ class Tokenizer:
 
     Attributes:
         input (DewStr): A custom string derived from `DewStr` class.
+        limits (Limits): The limits enforced while tokenizing.
     """
 
     input: str
 
+    limits: Limits = DEFAULT_LIMITS
+
     pos: int = -1
 
     _peeked: bool = False
@@ -143,149 +175,154 @@ class Tokenizer:
 
         return ""
 
-    def __escape(self) -> str:
-        self.consume()  # skip the escape character
-        peeked = self.peek()
-
-        if peeked:
-            return self.consume()
-
-        err = f"expected a character to escape, found '{peeked}'"
-
-        raise TokenizerError(err)
-
     def __tokenize_whitespace(self) -> Token:
-        peeked = self.peek()
+        start = self.pos + 1
+        end = WHITESPACES_RUN.match(self.input, start).end()
 
-        whitespaces = ""
+        self.pos = end - 1
+        self._peeked = False
 
-        while peeked is not None:
-            if peeked in WHITESPACES:
-                whitespaces += self.consume()
+        return "WHITESPACES", self.input[start:end]
 
-            else:
-                break
-
-            peeked = self.peek()
+    def __tokenize_value(self, run: re.Pattern[str], closing: str | None) -> Token:
+        inp = self.input
+        limit = self.limits.max_value_length
+        token_start = start = self.pos + 1
 
-        return "WHITESPACES", whitespaces
-
-    def __tokenize_unquoted_value(self) -> Token:
-        peeked = self.peek()
-
-        unquoted_value_characters = ""
-        while peeked is not None:
-            if peeked in VALID_VALUE_CHARACTERS:
-                unquoted_value_characters += self.consume()
+        if closing is not None:
+            start += 1  # escape the starting quotes
 
-            elif peeked == ESCAPE_CHARACTER:
-                unquoted_value_characters += self.__escape()
+        parts: list[str] = []
+        length = 0
 
-            else:
-                break
+        while True:
+            # bound the scan so an overlong value is rejected without
+            # reading past the limit
+            endpos = len(inp) if limit is None else start + limit - length + 1
+            end = run.match(inp, start, endpos).end()
 
-            peeked = self.peek()
-        return "VALUE", unquoted_value_characters
+            parts.append(inp[start:end])
+            length += end - start
 
-    def __tokenize_double_quoted_value(self) -> Token:
-        self.consume()  # escape the starting quotes
+            if limit is not None and length > limit:
+                err = f"value at position {token_start} exceeds {limit} characters"
 
-        peeked = self.peek()
-        double_quoted_value_characters = ""
+                raise LimitExceeded(err)
 
-        while peeked is not None:
-            if peeked == DOUBLE_QUOTES:
-                self.consume()  # escape the ending quotes
+            if end == len(inp):
+                start = end
                 break
 
-            if peeked in (
-                VALID_VALUE_CHARACTERS
-                + ASSIGNMENT_OPERATOR
-                + SINGLE_QUOTE
-                + WHITESPACES
-            ):
-                double_quoted_value_characters += self.consume()
-
-            elif peeked == ESCAPE_CHARACTER:
-                double_quoted_value_characters += self.__escape()
-
-            else:
-                err = f"unknown character '{peeked}'"
+            char = inp[end]
 
-                raise TokenizerError(err)
+            if char == ESCAPE_CHARACTER:
+                if end + 1 == len(inp):
+                    err = "expected a character to escape, found 'None'"
 
-            peeked = self.peek()
+                    raise TokenizerError(err)
 
-        return "VALUE", double_quoted_value_characters
+                parts.append(inp[end + 1])
+                length += 1
+                start = end + 2
 
-    def __tokenize_single_quoted_value(self) -> Token:
-        self.consume()  # escape the quotes
+                if limit is not None and length > limit:
+                    err = f"value at position {token_start} exceeds {limit} characters"
 
-        peeked = self.peek()
-        single_quoted_value_characters = ""
+                    raise LimitExceeded(err)
 
-        while peeked is not None:
-            if peeked == SINGLE_QUOTE:
-                self.consume()  # escape the quotes
+            elif closing is None:
+                start = end
                 break
 
-            if peeked in (
-                VALID_VALUE_CHARACTERS
-                + ASSIGNMENT_OPERATOR
-                + SINGLE_QUOTE
-                + WHITESPACES
-            ):
-                single_quoted_value_characters += self.consume()
-
-            elif peeked == ESCAPE_CHARACTER:
-                single_quoted_value_characters += self.__escape()
+            elif char == closing:
+                start = end + 1  # escape the ending quotes
+                break
 
             else:
-                err = f"unknown character '{peeked}'"
+                err = f"unknown character '{char}'"
 
                 raise TokenizerError(err)
 
-        return "VALUE", single_quoted_value_characters
+        self.pos = start - 1
+        self._peeked = False
+
+        return "VALUE", "".join(parts)
 
     def __tokenize_assignment_operator(self) -> Token:
         value = self.consume()
 
         return "ASSIGN_OP", value
 
-    def tokenize(self) -> list[Token]:
-        """The tokenizer class for converting input string to tokens.
+    def iter_tokens(self) -> t.Iterator[Token]:
+        """Lazily converts the input string to tokens.
 
-        Returns:
-            list[str]: List of `Token`.
+        Yields:
+            Token: The next `Token`.
+
+        Raises:
+            LimitExceeded: raised when the input exceeds
+            `Tokenizer.limits`.
         """
-        tokens: list[Token]
-        tokens = []
+        max_input_length = self.limits.max_input_length
+        max_tokens = self.limits.max_tokens
+
+        if max_input_length is not None and len(self.input) > max_input_length:
+            err = f"input exceeds {max_input_length} characters"
+
+            raise LimitExceeded(err)
+
+        count = 0
 
         peeked = self.peek()
         while peeked is not None:
+            if max_tokens is not None and count >= max_tokens:
+                err = f"input exceeds {max_tokens} tokens"
+
+                raise LimitExceeded(err)
+
             if peeked in WHITESPACES:
-                tokens.append(self.__tokenize_whitespace())
+                yield self.__tokenize_whitespace()
 
             elif peeked in VALID_UNQUOTED_VALUE_CHARACTERS:
-                tokens.append(self.__tokenize_unquoted_value())
+                yield self.__tokenize_value(UNQUOTED_RUN, None)
 
             elif peeked == DOUBLE_QUOTES:
-                tokens.append(self.__tokenize_double_quoted_value())
+                yield self.__tokenize_value(DOUBLE_QUOTED_RUN, DOUBLE_QUOTES)
 
             elif peeked == SINGLE_QUOTE:
-                tokens.append(self.__tokenize_single_quoted_value())
+                yield self.__tokenize_value(SINGLE_QUOTED_RUN, SINGLE_QUOTE)
 
             elif peeked == ASSIGNMENT_OPERATOR:
-                tokens.append(self.__tokenize_assignment_operator())
+                yield self.__tokenize_assignment_operator()
 
             else:
                 err = f"unknown character '{peeked}'"
 
                 raise TokenizerError(err)
 
+            count += 1
             peeked = self.peek()
 
-        return tokens
+    def tokenize(self) -> list[Token]:
+        """The tokenizer class for converting input string to tokens.
+
+        Returns:
+            list[str]: List of `Token`.
+
+        Raises:
+            LimitExceeded: raised when the input exceeds
+            `Tokenizer.limits`.
+        """
+        return list(self.iter_tokens())
+
+
+def _describe(token: Token) -> str:
+    token_type, value = token
+
+    if len(value) > MAX_REPORTED_VALUE_LENGTH:
+        value = f"{value[:MAX_REPORTED_VALUE_LENGTH]}... ({len(value)} characters)"
+
+    return str((token_type, value))
 
 
 @dataclasses.dataclass
@@ -293,19 +330,43 @@ class Parser:
     """The Parser class for converting list of tokens into `Command`.
 
     Attributes:
-        tokens (list[Token]): list of tokens.
+        tokens (Iterable[Token]): list of tokens, or a lazy iterable of
+            tokens such as `Tokenizer.iter_tokens()`.
+        limits (Limits): The limits enforced while parsing.
     """
 
-    tokens: list[Token]
+    tokens: t.Iterable[Token]
 
-    def __peek_token(self) -> Token | None:
-        try:
-            return self.tokens[0]
-        except IndexError:
-            return None
+    limits: Limits = DEFAULT_LIMITS
+
+    pos: int = 0
 
-    def __consume_token(self) -> Token | None:
-        return self.tokens.pop(0)
+    _iterator: t.Iterator[Token] = dataclasses.field(init=False, repr=False)
+
+    _lookahead: collections.deque[Token] = dataclasses.field(
+        init=False,
+        repr=False,
+        default_factory=collections.deque,
+    )
+
+    def __post_init__(self) -> None:  # noqa: D105
+        self._iterator = iter(self.tokens)
+
+    def __peek_token(self, offset: int = 0) -> Token | None:
+        while len(self._lookahead) <= offset:
+            token = next(self._iterator, None)
+
+            if token is None:
+                return None
+
+            self._lookahead.append(token)
+
+        return self._lookahead[offset]
+
+    def __consume_token(self) -> Token:
+        self.pos += 1
+
+        return self._lookahead.popleft()
 
     def __escape_whitespace(self) -> None:
         peeked = self.__peek_token()
@@ -314,64 +375,57 @@ class Parser:
             self.__consume_token()
 
     def __check_unparsed(self) -> None:
-        if len(self.tokens) != 0:
-            err = f"unparsed tokens: {self.tokens}"
+        peeked = self.__peek_token()
+
+        if peeked is not None:
+            err = f"unparsed token at token {self.pos}: {_describe(peeked)}"
 
             raise ParserError(err)
 
-    def __parse_arg(self) -> Argument:
-        peeked = self.__peek_token()
+    def __check_args_count(self, count: int) -> None:
+        limit = self.limits.max_args
 
-        if peeked:
-            if peeked[0] == "VALUE":
-                token = self.__consume_token()
+        if limit is not None and count > limit:
+            err = f"input exceeds {limit} arguments"
 
-                if token:
-                    value = token[1]
-                    return Argument(PositionalArgument(value))
+            raise LimitExceeded(err)
 
-                err = "expected value token, found None"
-                raise ParserError(err)
+    def __is_kwarg_name(self) -> bool:
+        peeked = self.__peek_token(1)
 
-            err = f"expected value token, found {peeked}"
-            raise ParserError(err)
-
-        err = "expected value token, found None"
-        raise ParserError(err)
+        if peeked is not None and peeked[0] == "WHITESPACES":
+            peeked = self.__peek_token(2)
 
-    def __parse_args(self) -> list[Argument]:
-        return self.__recursive_parse_args([])
+        return peeked is not None and peeked[0] == "ASSIGN_OP"
 
-    def __recursive_parse_args(
-        self,
-        acc: list[Argument],
-    ) -> list[Argument]:
+    def __parse_value(self) -> str:
         peeked = self.__peek_token()
 
         if peeked:
-            tokens = self.tokens.copy()
             if peeked[0] == "VALUE":
-                new_acc = [*acc, self.__parse_arg()]
-                self.__escape_whitespace()
+                return self.__consume_token()[1]
+
+            err = f"expected value token at token {self.pos}, found {_describe(peeked)}"
+            raise ParserError(err)
 
-                peeked = self.__peek_token()
+        err = "expected value token, found None"
+        raise ParserError(err)
 
-                if peeked:
-                    if peeked[0] == "VALUE":
-                        return self.__recursive_parse_args(new_acc)
+    def __iter_args(self) -> t.Iterator[str]:
+        count = 0
 
-                    if peeked[0] == "ASSIGN_OP":
-                        self.tokens = tokens
-                        return acc
+        peeked = self.__peek_token()
 
-                    err = f"unknown token: {peeked}"
-                    raise ParserError(err)
+        while peeked and peeked[0] == "VALUE" and not self.__is_kwarg_name():
+            arg = self.__parse_value()
+            self.__escape_whitespace()
 
-                return new_acc
+            count += 1
+            self.__check_args_count(count)
 
-            return acc
+            yield arg
 
-        return acc
+            peeked = self.__peek_token()
 
     def __parse_assign_op(self) -> None:
         peeked = self.__peek_token()
@@ -383,76 +437,130 @@ class Parser:
                 self.__escape_whitespace()
 
             else:
-                err = f"expected a assign_operator token, found {peeked}"
+                err = (
+                    f"expected a assign_operator token at token {self.pos}, "
+                    f"found {_describe(peeked)}"
+                )
                 raise ParserError(err)
         else:
             err = "expected a assign_operator token, found None"
             raise ParserError(err)
 
-    def __parse_kwarg(self) -> Argument:
+    def __parse_kwarg(self) -> tuple[str, str]:
         peeked = self.__peek_token()
 
         if peeked and peeked[0] == "VALUE":
-            kwarg_name = self.__parse_arg().value
+            kwarg_name = self.__parse_value()
 
             self.__escape_whitespace()
             self.__parse_assign_op()
             self.__escape_whitespace()
 
-            kwarg_value = self.__parse_arg().value
+            kwarg_value = self.__parse_value()
 
-            return Argument(KeywordArgument(kwarg_name.value, kwarg_value.value))
+            return kwarg_name, kwarg_value
 
-        err = f"expected value token, found {peeked}"
+        err = f"expected value token at token {self.pos}, found {_describe(peeked)}"
         raise ParserError(err)
 
-    def __parse_kwargs(self) -> list[Argument]:
-        return self.__recursive_parse_kwargs([])
+    def __iter_kwargs(self, parsed: int) -> t.Iterator[tuple[str, str]]:
+        count = parsed
 
-    def __recursive_parse_kwargs(
-        self,
-        acc: list[Argument],
-    ) -> list[Argument]:
         peeked = self.__peek_token()
 
-        if peeked:
-            if peeked[0] == "VALUE":
-                acc = [*acc, self.__parse_kwarg()]
+        while peeked:
+            if peeked[0] != "VALUE":
+                err = (
+                    f"expected value token at token {self.pos}, "
+                    f"found {_describe(peeked)}"
+                )
+                raise ParserError(err)
 
-                self.__escape_whitespace()
-                return self.__recursive_parse_kwargs(acc)
+            kwarg = self.__parse_kwarg()
 
-            err = f"expected value token, found {peeked}"
-            raise ParserError(err)
+            count += 1
+            self.__check_args_count(count)
 
-        return acc
+            yield kwarg
 
-    def parse(self) -> list[Argument]:
-        """Parses the tokens into `Command`.
+            self.__escape_whitespace()
+            peeked = self.__peek_token()
 
-        Returns:
-            `Command`: The parsed command data.
+    def iter_values(self) -> t.Iterator[tuple[str | None, str]]:
+        """Lazily parses the tokens into plain `(name, value)` pairs.
+
+        Same as `Parser.iter_parse()` without building `Argument`
+        objects, the name is `None` for positional arguments.
+
+        Yields:
+            tuple[str | None, str]: The next argument name and value.
+
+        Raises:
+            LimitExceeded: raised when the input exceeds
+            `Parser.limits`.
         """
         self.__escape_whitespace()
 
-        posargs = self.__parse_args()
+        parsed = 0
+
+        for value in self.__iter_args():
+            parsed += 1
+
+            yield None, value
+
         self.__escape_whitespace()
 
-        kwargs = self.__parse_kwargs()
+        yield from self.__iter_kwargs(parsed)
+
         self.__check_unparsed()
 
-        return posargs + kwargs
+    def iter_parse(self) -> t.Iterator[Argument]:
+        """Lazily parses the tokens, one `Argument` at a time.
+
+        Tokens are only pulled as far as needed to produce the next
+        `Argument`, so abandoning the iterator early skips the rest of
+        the input.
+
+        Yields:
+            Argument: The next parsed argument.
 
+        Raises:
+            LimitExceeded: raised when the input exceeds
+            `Parser.limits`.
+        """
+        for name, value in self.iter_values():
+            if name is None:
+                yield Argument(PositionalArgument(value))
+            else:
+                yield Argument(KeywordArgument(name, value))
+
+    def parse(self) -> list[Argument]:
+        """Parses the tokens into `Command`.
 
-def parse(inp: str) -> list[Argument]:
+        Returns:
+            `Command`: The parsed command data.
+
+        Raises:
+            LimitExceeded: raised when the input exceeds
+            `Parser.limits`.
+        """
+        return list(self.iter_parse())
+
+
+def parse(inp: str, limits: Limits = DEFAULT_LIMITS) -> list[Argument]:
     """Parses the dew command language into `Command`.
 
     Parameters:
         inp (str): The input to be parsed.
+        limits (Limits): The limits enforced on the input, unlimited by
+            default.
 
     Returns:
         Command: The parsed command data.
+
+    Raises:
+        LimitExceeded: raised when the input exceeds `limits`.
     """
-    tokens = Tokenizer(inp).tokenize()
+    tokens = Tokenizer(inp, limits).iter_tokens()
 
-    return Parser(tokens).parse()
+    return Parser(tokens, limits).parse()
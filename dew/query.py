@@ -0,0 +1,342 @@
+# MIT License
+#
+# Copyright (c) 2025 jma
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# ruff: noqa: W505
+
+"""dew query predicates for scanning command logs.
+
+Predicates are evaluated while each line is being tokenized, a line is
+abandoned as soon as it can no longer match.
+
+```py
+import dew
+
+lines = ["ban user", "add mode=fast", "add mode=slow"]
+where = (dew.q.arg(0) == "ban") | (dew.q.kwarg("mode") == "fast")
+
+for args in dew.scan(lines, where):
+    print(args)
+
+# [Argument(PositionalArgument("ban")), Argument(PositionalArgument("user"))]
+# [Argument(PositionalArgument("add")), Argument(KeywordArgument("mode", "fast"))]
+```
+"""
+
+from __future__ import annotations
+
+import abc
+import dataclasses
+
+import typing_extensions as t
+
+from dew.error import LimitExceeded, ParserError, TokenizerError
+from dew.parser import DEFAULT_LIMITS, Parser, Tokenizer
+from dew.types import Argument, KeywordArgument, Limits
+
+
+@dataclasses.dataclass
+class _State:
+    """The arguments of a line seen so far."""
+
+    args: list[str] = dataclasses.field(default_factory=list)
+
+    kwargs: dict[str, str] = dataclasses.field(default_factory=dict)
+
+    complete: bool = False
+
+    def add(self, argument: Argument) -> None:
+        value = argument.value
+
+        if isinstance(value, KeywordArgument):
+            self.kwargs.setdefault(value.name, value.value)
+        else:
+            self.args.append(value.value)
+
+
+class Predicate(abc.ABC):
+    """The base class of the predicates.
+
+    Predicates are combined with `&`, `|` and `~`.
+    """
+
+    @abc.abstractmethod
+    def evaluate(self, state: _State) -> bool | None:
+        """Evaluates the predicate against a partially parsed line.
+
+        Parameters:
+            state (_State): The arguments of the line seen so far.
+
+        Returns:
+            bool | None: Whether the line matches, `None` if it cannot
+            be decided yet.
+        """
+
+    def __and__(self, other: Predicate) -> Predicate:  # noqa: D105
+        return _And(self, other)
+
+    def __or__(self, other: Predicate) -> Predicate:  # noqa: D105
+        return _Or(self, other)
+
+    def __invert__(self) -> Predicate:  # noqa: D105
+        return _Not(self)
+
+    def __bool__(self) -> bool:  # noqa: D105
+        err = "use '&', '|' and '~' to combine predicates"
+
+        raise TypeError(err)
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class _And(Predicate):
+    left: Predicate
+    right: Predicate
+
+    def evaluate(self, state: _State) -> bool | None:
+        left = self.left.evaluate(state)
+
+        if left is False:
+            return False
+
+        right = self.right.evaluate(state)
+
+        if right is False:
+            return False
+
+        if left and right:
+            return True
+
+        return None
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class _Or(Predicate):
+    left: Predicate
+    right: Predicate
+
+    def evaluate(self, state: _State) -> bool | None:
+        left = self.left.evaluate(state)
+
+        if left is True:
+            return True
+
+        right = self.right.evaluate(state)
+
+        if right is True:
+            return True
+
+        if left is False and right is False:
+            return False
+
+        return None
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class _Not(Predicate):
+    predicate: Predicate
+
+    def evaluate(self, state: _State) -> bool | None:
+        result = self.predicate.evaluate(state)
+
+        return None if result is None else not result
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class _Compare(Predicate):
+    field: Field
+    test: t.Callable[[str | None], bool]
+
+    def evaluate(self, state: _State) -> bool | None:
+        known, value = self.field.resolve(state)
+
+        return self.test(value) if known else None
+
+
+class Field(abc.ABC):
+    """The base class of the argument references.
+
+    Comparing a field returns a `Predicate`, a missing argument never
+    equals a value.
+    """
+
+    @abc.abstractmethod
+    def resolve(self, state: _State) -> tuple[bool, str | None]:
+        """Resolves the value of the field against a partially parsed line.
+
+        Parameters:
+            state (_State): The arguments of the line seen so far.
+
+        Returns:
+            tuple[bool, str | None]: Whether the value is known yet and
+            the value, `None` if the argument is missing.
+        """
+
+    def __eq__(self, other: object) -> Predicate:  # type: ignore[override]  # noqa: D105
+        return _Compare(self, lambda value: value == other)
+
+    def __ne__(self, other: object) -> Predicate:  # type: ignore[override]  # noqa: D105
+        return _Compare(self, lambda value: value != other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def isin(self, values: t.Iterable[str]) -> Predicate:
+        """Tests whether the field is one of the given values.
+
+        Parameters:
+            values (Iterable[str]): The accepted values.
+
+        Returns:
+            Predicate: The membership predicate.
+        """
+        accepted = frozenset(values)
+
+        return _Compare(self, lambda value: value in accepted)
+
+    def exists(self) -> Predicate:
+        """Tests whether the argument is present.
+
+        Returns:
+            Predicate: The presence predicate.
+        """
+        return _Compare(self, lambda value: value is not None)
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class _ArgField(Field):
+    index: int
+
+    def resolve(self, state: _State) -> tuple[bool, str | None]:
+        if self.index < len(state.args):
+            return True, state.args[self.index]
+
+        # positional arguments always come before keyword arguments
+        if state.complete or state.kwargs:
+            return True, None
+
+        return False, None
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class _KwargField(Field):
+    name: str
+
+    def resolve(self, state: _State) -> tuple[bool, str | None]:
+        if self.name in state.kwargs:
+            return True, state.kwargs[self.name]
+
+        if state.complete:
+            return True, None
+
+        return False, None
+
+
+def arg(index: int) -> Field:
+    """References a positional argument.
+
+    Parameters:
+        index (int): The zero-based position of the argument.
+
+    Returns:
+        Field: The positional argument reference.
+
+    Raises:
+        ValueError: raised when the index is negative.
+    """
+    if index < 0:
+        err = f"expected a non-negative index, found {index}"
+
+        raise ValueError(err)
+
+    return _ArgField(index)
+
+
+def kwarg(name: str) -> Field:
+    """References a keyword argument, its first occurrence if repeated.
+
+    Parameters:
+        name (str): The name of the keyword argument.
+
+    Returns:
+        Field: The keyword argument reference.
+    """
+    return _KwargField(name)
+
+
+def scan(
+    lines: t.Iterable[str],
+    where: Predicate,
+    limits: Limits = DEFAULT_LIMITS,
+    on_error: t.Callable[[int, Exception], None] | None = None,
+) -> t.Iterator[list[Argument]]:
+    """Parses only the lines matching a predicate.
+
+    Each line is tokenized and parsed lazily while the predicate is
+    evaluated, a line is abandoned as soon as it cannot match.
+
+    Invalid lines are always skipped, whatever the predicate. Since
+    abandoned lines are not read past that point, only errors found
+    before a line is abandoned are reported to `on_error`.
+
+    Parameters:
+        lines (Iterable[str]): The inputs to be scanned.
+        where (Predicate): The predicate the lines must match.
+        limits (Limits): The limits enforced on each line, unlimited by
+            default.
+        on_error (Callable[[int, Exception], None] | None): Called with
+            the index of each invalid line found and its error.
+
+    Yields:
+        list[Argument]: The parsed arguments of each matching line.
+    """
+    for index, line in enumerate(lines):
+        state = _State()
+        result = where.evaluate(state)
+
+        if result is False:
+            continue
+
+        tokens = Tokenizer(line, limits).iter_tokens()
+        args: list[Argument] = []
+
+        try:
+            for argument in Parser(tokens, limits).iter_parse():
+                args.append(argument)
+
+                if result is None:
+                    state.add(argument)
+                    result = where.evaluate(state)
+
+                    if result is False:
+                        break
+
+            else:
+                if result is None:
+                    state.complete = True
+                    result = where.evaluate(state)
+
+        except (TokenizerError, ParserError, LimitExceeded) as e:
+            if on_error is not None:
+                on_error(index, e)
+
+            continue
+
+        if result:
+            yield args
@@ -0,0 +1,292 @@
+# MIT License
+#
+# Copyright (c) 2025 jma
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# ruff: noqa: W505
+
+"""dew prepared command templates.
+
+A template is parsed once, binding values to it afterwards skips the
+tokenizer entirely.
+
+```py
+import dew
+
+command = dew.prepare("add rgb color r={} g={} b={}")
+
+command.bind(r=100, g=150, b=200)
+# [Argument(PositionalArgument("add")), ..., Argument(KeywordArgument("b", "200"))]
+
+command.format(r=100, g=150, b="very blue")
+# 'add rgb color r=100 g=150 b="very blue"'
+```
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import re
+
+import typing_extensions as t
+
+from dew.error import TemplateError
+from dew.parser import (
+    ASSIGNMENT_OPERATOR,
+    DOUBLE_QUOTES,
+    ESCAPE_CHARACTER,
+    SINGLE_QUOTE,
+    VALID_VALUE_CHARACTERS,
+    parse,
+)
+from dew.types import Argument, KeywordArgument, PositionalArgument
+
+PLACEHOLDER: t.Final[re.Pattern[str]] = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)?\}")
+
+ESCAPED_BRACES: t.Final[re.Pattern[str]] = re.compile(r"\{(\{.*\})\}", re.DOTALL)
+
+UNQUOTED_VALUE: t.Final[re.Pattern[str]] = re.compile(
+    f"[{re.escape(VALID_VALUE_CHARACTERS)}]+"
+)
+
+DOUBLE_QUOTED_ESCAPED: t.Final[re.Pattern[str]] = re.compile(
+    f"[^{re.escape(VALID_VALUE_CHARACTERS + ASSIGNMENT_OPERATOR + SINGLE_QUOTE)} ]"
+)
+
+
+def quote(value: str) -> str:
+    """Quotes a value so that it parses back to itself.
+
+    Values made only of valid unquoted characters are returned as is,
+    anything else is double quoted with the remaining special characters
+    escaped.
+
+    Parameters:
+        value (str): The value to quote.
+
+    Returns:
+        str: The quoted value.
+    """
+    if UNQUOTED_VALUE.fullmatch(value):
+        return value
+
+    escaped = DOUBLE_QUOTED_ESCAPED.sub(
+        lambda match: ESCAPE_CHARACTER + match[0], value
+    )
+
+    return DOUBLE_QUOTES + escaped + DOUBLE_QUOTES
+
+
+class _Part(t.NamedTuple):
+    """An argument of a template, either literal or a placeholder."""
+
+    argument: Argument
+    """
+    The literal argument, its value is ignored for placeholders.
+    """
+
+    placeholder: str | None
+    """
+    The name of the placeholder bound to the value, `None` if literal.
+    """
+
+    prefix: str
+    """
+    The serialized keyword argument name and operator, if any.
+    """
+
+    text: str
+    """
+    The serialized literal value, empty for placeholders.
+    """
+
+
+@dataclasses.dataclass(frozen=True)
+class PreparedCommand:
+    """A parsed command template with placeholders in value positions.
+
+    Attributes:
+        template (str): The template the command was prepared from.
+        placeholders (tuple[str, ...]): The placeholder names, in order
+            of first appearance.
+    """
+
+    template: str
+
+    placeholders: tuple[str, ...]
+
+    _parts: tuple[_Part, ...] = dataclasses.field(repr=False)
+
+    def __resolve(self, values: dict[str, object]) -> dict[str, str]:
+        missing = [name for name in self.placeholders if name not in values]
+
+        if missing:
+            err = f"missing values for placeholders: {', '.join(missing)}"
+
+            raise TemplateError(err)
+
+        if len(values) != len(self.placeholders):
+            unexpected = [name for name in values if name not in self.placeholders]
+
+            err = f"unexpected values: {', '.join(unexpected)}"
+
+            raise TemplateError(err)
+
+        return {name: str(value) for name, value in values.items()}
+
+    def bind(self, /, **values: object) -> list[Argument]:
+        """Binds values to the placeholders into the parsed command.
+
+        Values are converted with `str()`.
+
+        Parameters:
+            **values (object): The value of each placeholder.
+
+        Returns:
+            list[Argument]: The parsed command data, as `dew.parse`
+            would return for `PreparedCommand.format(**values)`.
+
+        Raises:
+            TemplateError: raised when a placeholder is missing a value
+            or a value has no placeholder.
+        """
+        resolved = self.__resolve(values)
+
+        args: list[Argument] = []
+
+        for part in self._parts:
+            if part.placeholder is None:
+                args.append(part.argument)
+                continue
+
+            value = resolved[part.placeholder]
+            literal = part.argument.value
+
+            if isinstance(literal, KeywordArgument):
+                args.append(Argument(KeywordArgument(literal.name, value)))
+            else:
+                args.append(Argument(PositionalArgument(value)))
+
+        return args
+
+    def format(self, /, **values: object) -> str:
+        """Binds values to the placeholders into the command string.
+
+        Values are converted with `str()` and quoted where needed.
+
+        Parameters:
+            **values (object): The value of each placeholder.
+
+        Returns:
+            str: The serialized command.
+
+        Raises:
+            TemplateError: raised when a placeholder is missing a value
+            or a value has no placeholder.
+        """
+        resolved = self.__resolve(values)
+
+        texts: list[str] = []
+
+        for part in self._parts:
+            if part.placeholder is None:
+                texts.append(part.prefix + part.text)
+            else:
+                texts.append(part.prefix + quote(resolved[part.placeholder]))
+
+        return " ".join(texts)
+
+
+def _unescape(value: str) -> str:
+    match = ESCAPED_BRACES.fullmatch(value)
+
+    return value if match is None else match[1]
+
+
+def prepare(template: str) -> PreparedCommand:
+    """Parses a command template once for repeated binding.
+
+    Values of the form `{name}` are placeholders, a keyword argument
+    value `{}` is a placeholder named after its keyword. Quoting does
+    not escape placeholders, a value wrapped in doubled braces such as
+    `{{name}}` is the literal `{name}` instead.
+
+    ```py
+    dew.prepare("{action} user={} reason={why} note={{literal}}")
+    ```
+
+    Parameters:
+        template (str): The template to be parsed.
+
+    Returns:
+        PreparedCommand: The prepared command.
+
+    Raises:
+        TemplateError: raised when a placeholder is not in a value
+        position or a positional placeholder has no name.
+    """
+    parts: list[_Part] = []
+    placeholders: dict[str, None] = {}
+
+    for arg in parse(template):
+        literal = arg.value
+        keyword: str | None = None
+
+        if isinstance(literal, KeywordArgument):
+            if PLACEHOLDER.fullmatch(literal.name):
+                err = f"placeholder '{literal.name}' is not in a value position"
+
+                raise TemplateError(err)
+
+            keyword = _unescape(literal.name)
+            prefix = quote(keyword) + ASSIGNMENT_OPERATOR
+        else:
+            prefix = ""
+
+        match = PLACEHOLDER.fullmatch(literal.value)
+
+        if match is None:
+            value = _unescape(literal.value)
+            literal = (
+                PositionalArgument(value)
+                if keyword is None
+                else KeywordArgument(keyword, value)
+            )
+
+            parts.append(_Part(Argument(literal), None, prefix, quote(value)))
+            continue
+
+        name = match[1]
+
+        if name is None:
+            if keyword is None:
+                err = "positional placeholders must be named, e.g. '{name}'"
+
+                raise TemplateError(err)
+
+            name = keyword
+
+        if keyword is not None:
+            literal = KeywordArgument(keyword, literal.value)
+
+        placeholders[name] = None
+        parts.append(_Part(Argument(literal), name, prefix, ""))
+
+    return PreparedCommand(template, tuple(placeholders), tuple(parts))
@@ -53,3 +53,31 @@ class Argument(t.NamedTuple):
 
     def __repr__(self) -> str:  # noqa: D105
         return f"Argument({self.value})"
+
+
+class Limits(t.NamedTuple):
+    """Represents the limits enforced on untrusted input.
+
+    A limit of `None` means unlimited.
+    """
+
+    max_input_length: int | None = None
+    """
+    The maximum number of characters of the input.
+    """
+
+    max_tokens: int | None = None
+    """
+    The maximum number of tokens, including whitespaces.
+    """
+
+    max_args: int | None = None
+    """
+    The maximum number of positional and keyword arguments combined.
+    """
+
+    max_value_length: int | None = None
+    """
+    The maximum number of characters of a single value. Whitespace runs
+    are only bounded by `max_input_length`.
+    """
@@ -0,0 +1,94 @@
+import json
+
+
+def test_jsonl_output(tmp_path):
+    from dew.cli import main
+
+    inp = tmp_path / "commands.txt"
+    out = tmp_path / "commands.jsonl"
+    inp.write_text('add rgb color r=100 g= 150 b=200\n\nrgb "nice argument"\n')
+
+    assert main([str(inp), "-o", str(out)]) == 0
+
+    records = [json.loads(line) for line in out.read_text().splitlines()]
+    assert records == [
+        {
+            "args": ["add", "rgb", "color"],
+            "kwargs": [["r", "100"], ["g", "150"], ["b", "200"]],
+        },
+        {"args": ["rgb", "nice argument"], "kwargs": []},
+    ]
+
+
+def test_tsv_output(tmp_path):
+    from dew.cli import main
+
+    inp = tmp_path / "commands.txt"
+    out = tmp_path / "commands.tsv"
+    inp.write_text('add r=100\n"a\tb"\n')
+
+    assert main([str(inp), str(inp), "-o", str(out), "--format", "tsv"]) == 0
+
+    rows = f"{inp}\t1\targ\t0\tadd\n{inp}\t1\tkwarg\tr\t100\n{inp}\t2\targ\t0\ta\\tb\n"
+    assert out.read_text() == rows * 2
+
+
+def test_errors_and_stats(tmp_path, capsys):
+    from dew.cli import main
+
+    inp = tmp_path / "commands.txt"
+    out = tmp_path / "commands.jsonl"
+    inp.write_text("add\nr=100 rgb\nrgb\n")
+
+    assert main([str(inp), "-o", str(out), "--stats"]) == 1
+
+    assert len(out.read_text().splitlines()) == 2
+
+    err = capsys.readouterr().err
+    assert f"{inp}:2: ParserError" in err
+    assert "commands: 2, errors: 1" in err
+
+
+def test_unreadable_files(tmp_path, capsys):
+    import pytest
+
+    from dew.cli import main
+
+    inp = tmp_path / "commands.txt"
+    inp.write_text("add\n")
+
+    with pytest.raises(SystemExit) as e:
+        main([str(tmp_path / "missing.txt")])
+
+    assert e.value.code == 2
+    assert "cannot open" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit) as e:
+        main([str(inp), "-o", str(tmp_path / "missing" / "out.jsonl")])
+
+    assert e.value.code == 2
+
+
+def test_workers(tmp_path):
+    from dew.cli import main
+
+    inp = tmp_path / "commands.txt"
+    out = tmp_path / "commands.jsonl"
+    inp.write_text("".join(f"cmd{i} n={i}\n" for i in range(10000)))
+
+    assert main([str(inp), "-o", str(out), "--workers", "2"]) == 0
+
+    records = [json.loads(line) for line in out.read_text().splitlines()]
+    assert records[-1] == {"args": ["cmd9999"], "kwargs": [["n", "9999"]]}
+    assert len(records) == 10000
+
+
+def test_validate_only(tmp_path):
+    from dew.cli import main
+
+    inp = tmp_path / "commands.txt"
+    out = tmp_path / "commands.jsonl"
+    inp.write_text("add\nrgb\n")
+
+    assert main([str(inp), "-o", str(out), "--validate-only"]) == 0
+    assert out.read_text() == ""
@@ -0,0 +1,97 @@
+import pytest
+
+
+def test_parse_columnar():
+    import dew
+
+    inputs = [
+        "add rgb color r=100 g= 150 b=200",
+        "",
+        "ban 'nice user' mode=caf\\é",
+    ]
+    batch = dew.parse_columnar(inputs)
+
+    assert len(batch) == 3
+
+    assert list(batch.args_offsets) == [0, 3, 3, 5]
+    assert list(batch.kwargs_offsets) == [0, 3, 3, 4]
+
+    assert batch.args(0) == ["add", "rgb", "color"]
+    assert batch.kwargs(0) == [("r", "100"), ("g", "150"), ("b", "200")]
+
+    assert batch.args(1) == []
+    assert batch.kwargs(1) == []
+
+    assert batch.args(-1) == ["ban", "nice user"]
+    assert batch.kwargs(-1) == [("mode", "café")]
+
+    for index, inp in enumerate(inputs):
+        assert batch[index] == dew.parse(inp)
+
+
+def test_parse_columnar_buffers():
+    import dew
+
+    batch = dew.parse_columnar(["a bb", "ccc k=v"])
+
+    assert bytes(batch.arg_data) == b"abbccc"
+    assert list(batch.arg_offsets) == [0, 1, 3, 6]
+    assert bytes(batch.kwarg_name_data) == b"k"
+    assert bytes(batch.kwarg_value_data) == b"v"
+
+
+def test_parse_columnar_index_error():
+    import dew
+
+    batch = dew.parse_columnar(["add"])
+
+    with pytest.raises(IndexError):
+        batch.args(1)
+
+
+def test_to_numpy():
+    np = pytest.importorskip("numpy")
+
+    import dew
+
+    batch = dew.parse_columnar(["add rgb r=100", "ban mode=fast"])
+    arrays = batch.to_numpy()
+
+    assert np.diff(arrays["args_offsets"]).tolist() == [2, 1]
+    assert arrays["arg_data"].tobytes() == b"addrgbban"
+    assert arrays["kwarg_value_offsets"].dtype == np.int64
+
+
+def test_parse_columnar_errors():
+    import dew
+    from dew.error import ParserError
+
+    inputs = ["add rgb", "add r=100 g", "ban mode=fast"]
+
+    with pytest.raises(ParserError, match="^input 1: "):
+        dew.parse_columnar(inputs)
+
+    batch = dew.parse_columnar(inputs, errors="skip")
+
+    assert len(batch) == 2
+    assert list(batch.skipped) == [1]
+    assert batch[0] == dew.parse(inputs[0])
+    assert batch[1] == dew.parse(inputs[2])
+    assert bytes(batch.kwarg_name_data) == b"mode"
+
+
+def test_parse_columnar_unencodable():
+    import dew
+
+    inputs = ["a b=1", "a \\\ud800 c=2", "d"]
+
+    with pytest.raises(ValueError, match="^input 1: "):
+        dew.parse_columnar(inputs)
+
+    batch = dew.parse_columnar(inputs, errors="skip")
+
+    assert list(batch.skipped) == [1]
+    assert [batch[i] for i in range(len(batch))] == [
+        dew.parse("a b=1"),
+        dew.parse("d"),
+    ]
@@ -0,0 +1,138 @@
+import random
+import threading
+import time
+
+import pytest
+
+from dew.error import LimitExceeded, ParserError, TokenizerError
+from dew.types import KeywordArgument, Limits
+
+
+def test_single_quoted_values():
+    import dew
+
+    args = dew.parse("'abc' 'say \"hi\"' name='nice argument'")
+
+    arg = args.pop(0).value.value
+    assert arg == "abc"
+
+    arg = args.pop(0).value.value
+    assert arg == 'say "hi"'
+
+    arg = args.pop(0).value
+    assert isinstance(arg, KeywordArgument)
+    assert arg.name == "name"
+    assert arg.value == "nice argument"
+
+
+def test_long_input():
+    import dew
+
+    args = dew.parse("arg " * 100_000 + "r=100 " * 100_000)
+
+    assert len(args) == 200_000
+
+
+@pytest.mark.parametrize(
+    ("inp", "limits"),
+    [
+        ("add rgb color", Limits(max_input_length=12)),
+        ("add rgb color", Limits(max_tokens=4)),
+        ("add rgb color", Limits(max_args=2)),
+        ("add r=100 g=150", Limits(max_args=2)),
+        ("add rgb color", Limits(max_value_length=4)),
+        ("add 'nice argument'", Limits(max_value_length=4)),
+    ],
+)
+def test_limit_exceeded(inp, limits):
+    import dew
+
+    with pytest.raises(LimitExceeded):
+        dew.parse(inp, limits)
+
+
+def test_within_limits():
+    import dew
+
+    limits = Limits(
+        max_input_length=13,
+        max_tokens=5,
+        max_args=3,
+        max_value_length=5,
+    )
+
+    assert len(dew.parse("add rgb color", limits)) == 3
+
+
+@pytest.mark.parametrize(
+    "inp",
+    [
+        " " * 2_000_000 + "a",
+        "a" * 2_000_000,
+        "'" + "a b" * 700_000 + "'",
+        '"' + '\\"' * 700_000 + '"',
+    ],
+)
+def test_long_runs_are_linear(inp):
+    import dew
+
+    started = time.perf_counter()
+    dew.parse(inp)
+
+    assert time.perf_counter() - started < 5
+
+
+def test_value_length_fails_fast():
+    import dew
+
+    started = time.perf_counter()
+
+    with pytest.raises(LimitExceeded):
+        dew.parse("'" + "a" * 10_000_000 + "'", Limits(max_value_length=128))
+
+    assert time.perf_counter() - started < 1
+
+
+def test_error_message_is_bounded():
+    import dew
+
+    with pytest.raises(ParserError) as e:
+        dew.parse("r=100 " + "rgb " * 10_000)
+
+    assert len(str(e.value)) < 200
+
+    with pytest.raises(ParserError) as e:
+        dew.parse("a=1 b " + "c" * 100_000)
+
+    assert len(str(e.value)) < 200
+
+    with pytest.raises(ParserError) as e:
+        dew.parse("a=1 " + "b" * 100_000)
+
+    assert len(str(e.value)) < 200
+
+
+def test_fuzz_terminates():
+    import dew
+
+    alphabet = "ab= \t\n\"'\\-é"
+    rng = random.Random(0)
+    failures = []
+
+    def fuzz():
+        for _ in range(20_000):
+            inp = "".join(rng.choices(alphabet, k=rng.randint(0, 24)))
+
+            try:
+                dew.parse(inp, Limits(max_tokens=16))
+            except (TokenizerError, ParserError, LimitExceeded):
+                pass
+            except Exception as e:  # noqa: BLE001
+                failures.append((inp, e))
+
+    worker = threading.Thread(target=fuzz, daemon=True)
+    worker.start()
+    worker.join(timeout=30)
+
+    assert not worker.is_alive()
+    assert failures == []
@@ -0,0 +1,94 @@
+import pytest
+
+LINES = [
+    "ban user1 reason=spam",
+    "add rgb color mode=fast",
+    "add rgb color mode=slow",
+    "kick user2",
+    "",
+]
+
+
+def test_scan_arg():
+    import dew
+
+    matches = list(dew.scan(LINES, dew.q.arg(0) == "ban"))
+
+    assert matches == [dew.parse(LINES[0])]
+
+
+def test_scan_kwarg():
+    import dew
+
+    matches = list(dew.scan(LINES, dew.q.kwarg("mode") == "fast"))
+
+    assert matches == [dew.parse(LINES[1])]
+
+
+def test_scan_combined():
+    import dew
+
+    q = dew.q
+
+    where = (q.arg(0) == "ban") | (q.kwarg("mode") == "fast")
+    assert list(dew.scan(LINES, where)) == [dew.parse(LINES[0]), dew.parse(LINES[1])]
+
+    where = (q.arg(0) == "add") & ~(q.kwarg("mode") == "fast")
+    assert list(dew.scan(LINES, where)) == [dew.parse(LINES[2])]
+
+    where = q.arg(0).isin(["ban", "kick"]) & (q.arg(1) != "user1")
+    assert list(dew.scan(LINES, where)) == [dew.parse(LINES[3])]
+
+    where = q.kwarg("reason").exists() | ~q.arg(0).exists()
+    assert list(dew.scan(LINES, where)) == [dew.parse(LINES[0]), []]
+
+
+def test_scan_short_circuits():
+    import dew
+
+    # the invalid character is never tokenized once the first argument mismatches
+    lines = ["kick user1 user2 \x01", "ban user1"]
+
+    matches = list(dew.scan(lines, dew.q.arg(0) == "ban"))
+
+    assert matches == [dew.parse(lines[1])]
+
+
+def test_scan_skips_invalid_lines():
+    import dew
+
+    lines = ["ban r=100 user1", "kick r=1 x", "ban user2"]
+
+    errors = []
+    where = dew.q.arg(0) == "ban"
+    matches = list(dew.scan(lines, where, on_error=lambda i, e: errors.append(i)))
+
+    assert matches == [dew.parse(lines[2])]
+    assert errors == [0]
+
+    errors = []
+    where = dew.q.kwarg("r") == "1"
+    matches = list(dew.scan(lines, where, on_error=lambda i, e: errors.append(i)))
+
+    assert matches == []
+    assert errors == [1]
+
+
+def test_abstract_bases():
+    from dew.query import Field, Predicate
+
+    class Incomplete(Predicate):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+    with pytest.raises(TypeError):
+        Field()
+
+
+def test_predicate_truthiness():
+    import dew
+
+    with pytest.raises(TypeError):
+        bool(dew.q.arg(0) == "ban")
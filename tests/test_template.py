@@ -0,0 +1,103 @@
+import pytest
+
+from dew.error import TemplateError
+
+
+def test_bind():
+    import dew
+
+    command = dew.prepare("add rgb color r={} g={} b={}")
+
+    assert command.placeholders == ("r", "g", "b")
+    assert command.bind(r=100, g=150, b=200) == dew.parse(
+        "add rgb color r=100 g=150 b=200"
+    )
+
+
+def test_named_placeholders():
+    import dew
+
+    command = dew.prepare("{action} user 'display name' reason={why} by={why}")
+
+    assert command.placeholders == ("action", "why")
+    assert command.bind(action="ban", why="spam") == dew.parse(
+        "ban user 'display name' reason=spam by=spam"
+    )
+    assert command.format(action="ban", why="spam") == (
+        'ban user "display name" reason=spam by=spam'
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "plain",
+        "with space",
+        "",
+        "r=100",
+        "'single' \"double\"",
+        "back\\slash",
+        "tab\tnew\nline",
+        "ünïcode",
+        "-dash",
+    ],
+)
+def test_format_round_trip(value):
+    import dew
+
+    command = dew.prepare("set {key} value={}")
+    formatted = command.format(key=value, value=value)
+
+    assert dew.parse(formatted) == command.bind(key=value, value=value)
+
+
+def test_bind_errors():
+    import dew
+
+    command = dew.prepare("add r={} g={}")
+
+    with pytest.raises(TemplateError, match="missing"):
+        command.bind(r=100)
+
+    with pytest.raises(TemplateError, match="unexpected"):
+        command.bind(r=100, g=150, b=200)
+
+
+def test_prepare_errors():
+    import dew
+
+    with pytest.raises(TemplateError):
+        dew.prepare("add {}")
+
+    with pytest.raises(TemplateError):
+        dew.prepare("add {name}=100")
+
+
+def test_self_placeholder():
+    import dew
+
+    command = dew.prepare("user self={}")
+
+    assert command.bind(self=1) == dew.parse("user self=1")
+    assert command.format(self=1) == "user self=1"
+
+
+def test_escaped_braces():
+    import dew
+
+    command = dew.prepare("say {{}} '{{x}}' {{{y}}} {{a}}={{b}} n={}")
+
+    assert command.placeholders == ("n",)
+
+    expected = dew.parse("say {} {x} {{y}} {a}={b} n=1")
+    assert command.bind(n=1) == expected
+    assert dew.parse(command.format(n=1)) == expected
+
+    command = dew.prepare("say {{a}}={x}")
+    assert command.bind(x=1) == dew.parse("say {a}=1")
+    assert command.bind(x=1) == dew.parse(command.format(x=1))
+
+    command = dew.prepare("say {{a}}={}")
+    assert command.placeholders == ("{a}",)
+    assert command.bind(**{"{a}": 1}) == dew.parse("say {a}=1")
+    assert command.bind(**{"{a}": 1}) == dew.parse(command.format(**{"{a}": 1}))